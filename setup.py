@@ -63,7 +63,7 @@ extras["pipeline-audio"] = [
     "webrtcvad-wheels>=2.0.14",
 ]
 
-extras["pipeline-data"] = ["beautifulsoup4>=4.9.3", "nltk>=3.5", "pandas>=1.1.0", "tika>=1.24"]
+extras["pipeline-data"] = ["beautifulsoup4>=4.9.3", "lxml>=4.6.0", "nltk>=3.5", "pandas>=1.1.0", "requests>=2.26.0", "tika>=1.24"]
 
 extras["pipeline-image"] = ["imagehash>=4.2.1", "pillow>=7.1.2", "timm>=0.4.12"]
 
@@ -65,15 +65,25 @@ class Segmentation(Pipeline):
 
         # Extract text for each input file
         results = []
-        for value in texts:
-            # Get text
-            value = self.text(value)
-
+        for value in self.texts(texts):
             # Parse and add extracted results
             results.append(self.parse(value))
 
         return results[0] if isinstance(text, str) else results
 
+    def texts(self, texts):
+        """
+        Hook to allow extracting text out of a list of input text objects. Defaults to running text for each input.
+
+        Args:
+            texts: list of objects to extract text from
+
+        Returns:
+            list of text
+        """
+
+        return [self.text(text) for text in texts]
+
     def text(self, text):
         """
         Hook to allow extracting text out of input text object.
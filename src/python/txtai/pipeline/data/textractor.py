@@ -2,26 +2,49 @@
 Textractor module
 """
 
-import contextlib
+import codecs
+import functools
 import os
 import re
+import shutil
 import tempfile
 
-from subprocess import Popen
-from urllib.parse import urlparse
-from urllib.request import urlopen, Request
+from multiprocessing.pool import ThreadPool
+from threading import Lock
+from urllib.parse import quote, urlparse
 
 # Conditional import
 try:
-    from bs4 import BeautifulSoup, NavigableString
-    from tika import detector, parser
+    import requests
+
+    from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+    from requests.adapters import HTTPAdapter
+    from tika import tika as tikaclient
 
     TIKA = True
 except ImportError:
     TIKA = False
 
+# Conditional import
+try:
+    # pylint: disable=W0611
+    import lxml
+
+    LXML = True
+except ImportError:
+    LXML = False
+
 from .segmentation import Segmentation
 
+# Guards Apache Tika server startup across threads. Module-level to keep Textractor instances picklable.
+LOCK = Lock()
+
+# Mimetypes for common file extensions
+EXTENSIONS = {".htm": "text/html", ".html": "text/html", ".md": "text/plain", ".txt": "text/plain", ".xhtml": "text/xhtml"}
+
+# Mimetypes for common file signatures (magic bytes)
+SIGNATURES = {b"%PDF-": "application/pdf", b"PK\x03\x04": "application/zip", b"\xd0\xcf\x11\xe0": "application/x-tika-msoffice"}
+
 
 class Textractor(Segmentation):
     """
@@ -29,7 +52,17 @@ class Textractor(Segmentation):
     """
 
     def __init__(
-        self, sentences=False, lines=False, paragraphs=False, minlength=None, join=False, tika=True, sections=False, cleantext=True, headers=None
+        self,
+        sentences=False,
+        lines=False,
+        paragraphs=False,
+        minlength=None,
+        join=False,
+        tika=True,
+        sections=False,
+        cleantext=True,
+        headers=None,
+        workers=None,
     ):
         if not TIKA:
             raise ImportError('Textractor pipeline is not available - install "pipeline" extra to enable')
@@ -46,6 +79,23 @@ class Textractor(Segmentation):
         # HTTP headers
         self.headers = headers if headers else {}
 
+        # HTTP session, reuses connections across requests
+        self.session = self.connection()
+
+        # Detected mimetypes, keyed by file identity
+        self.mimetypes = {}
+
+        # Number of concurrent workers for lists of inputs, runs serially if not set
+        self.workers = workers
+
+    def texts(self, texts):
+        # Run text extraction concurrently. This overlaps network requests and Tika parsing across inputs.
+        if self.workers and len(texts) > 1:
+            with ThreadPool(min(self.workers, len(texts))) as pool:
+                return pool.map(self.text, texts)
+
+        return super().texts(texts)
+
     def text(self, text):
         # Check if text is a valid file path or url
         path, exists = self.valid(text)
@@ -88,14 +138,23 @@ class Textractor(Segmentation):
         if not path:
             path = os.environ.get("TIKA_JAVA", "java")
 
-        # pylint: disable=R1732,W0702,W1514
-        # Check if java binary is available on path
-        try:
-            _ = Popen(path, stdout=open(os.devnull, "w"), stderr=open(os.devnull, "w"))
-        except:
-            return False
+        return Textractor.executable(path)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def executable(path):
+        """
+        Checks if path is an executable file or an executable on the system path. This method is wrapped with a cache
+        as the result is shared across all instances.
+
+        Args:
+            path: executable path or name
+
+        Returns:
+            True if executable is available, False otherwise
+        """
 
-        return True
+        return shutil.which(path) is not None
 
     def valid(self, path):
         """
@@ -110,13 +169,13 @@ class Textractor(Segmentation):
         """
 
         # Convert file urls to local paths
-        path = path.replace("file://", "")
+        path = path.removeprefix("file://")
 
         # Check if this is a local file path or local file url
         exists = os.path.exists(path)
 
         # Consider local files and HTTP urls valid
-        return (path if exists or urlparse(path).scheme in ("http", "https") else None, exists)
+        return (path if exists or path[:8].lower().startswith(("http://", "https://")) else None, exists)
 
     def download(self, url):
         """
@@ -132,8 +191,10 @@ class Textractor(Segmentation):
         with tempfile.NamedTemporaryFile(mode="wb", delete=False) as output:
             path = output.name
 
-            # Retrieve and write data to temporary file
-            output.write(self.retrieve(url))
+            # Stream data to temporary file in chunks
+            with self.request(url, stream=True) as response:
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, output, 65536)
 
         return path
 
@@ -154,28 +215,197 @@ class Textractor(Segmentation):
                 return f.read()
 
         # Remote file
-        with contextlib.closing(urlopen(Request(url, headers=self.headers))) as connection:
-            return connection.read()
+        return self.request(url).content
 
-    def html(self, path):
+    def request(self, url, stream=False):
+        """
+        Runs a HTTP GET request for url.
+
+        Args:
+            url: input url
+            stream: if True, the response body is streamed on read instead of loaded into memory
+
+        Returns:
+            response
+        """
+
+        response = self.session.get(url, headers=self.headers, stream=stream)
+        response.raise_for_status()
+
+        return response
+
+    def connection(self):
+        """
+        Creates a HTTP session with connection pooling. Connections are kept alive and reused
+        for subsequent requests to the same host.
+
+        Returns:
+            requests.Session
+        """
+
+        session = requests.Session()
+
+        # Pool connections for both http and https urls
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=2)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def html(self, path, mimetype=None):
         """
         Parses content to HTML using Apache Tika.
 
         Args:
             path: file path
+            mimetype: file mimetype, detected if not provided
 
         Returns:
             html
         """
 
         # Skip parsing if input is plain text or HTML
-        mimetype = detector.from_file(path)
+        mimetype = mimetype if mimetype else self.mimetype(path)
         if mimetype in ("text/plain", "text/html", "text/xhtml"):
             return self.retrieve(path)
 
+        # Send detected content type to skip detection on the Tika server. Generic container and
+        # binary types are left to Tika, which detects the specific format (docx, xlsx, doc etc).
+        headers = {"Accept": "application/json"}
+        if mimetype not in ("application/octet-stream", "application/x-tika-msoffice", "application/zip"):
+            headers["Content-Type"] = mimetype
+
         # Parse content to XHTML
-        parsed = parser.from_file(path, xmlContent=True)
-        return parsed["content"]
+        response = self.server("/rmeta/xml", path, headers)
+
+        # Join content from document and embedded documents
+        return "".join(x.get("X-TIKA:content", "") for x in response.json())
+
+    def mimetype(self, path):
+        """
+        Detects the mimetype of a file. The file extension and leading bytes are checked first for common
+        formats. Apache Tika detection is only run when the format can't be determined from these checks.
+
+        Args:
+            path: file path
+
+        Returns:
+            mimetype
+        """
+
+        # Check file extension
+        mimetype = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if mimetype:
+            return mimetype
+
+        # Check file signature
+        mimetype = self.sniff(path)
+        if mimetype:
+            return mimetype
+
+        # Fallback to Tika detection
+        return self.detect(path)
+
+    def sniff(self, path):
+        """
+        Detects the mimetype of a file using the file signature (magic bytes).
+
+        Args:
+            path: file path
+
+        Returns:
+            mimetype if the signature is known, None otherwise
+        """
+
+        with open(path, "rb") as f:
+            data = f.read(512)
+
+        # Binary formats
+        for signature, mimetype in SIGNATURES.items():
+            if data.startswith(signature):
+                return mimetype
+
+        # HTML documents, skip byte order mark and leading whitespace
+        data = data.removeprefix(b"\xef\xbb\xbf").lstrip().lower()
+        if data.startswith((b"<html", b"<!doctype html")):
+            return "text/html"
+
+        return None
+
+    def detect(self, path):
+        """
+        Detects the mimetype of a file using Apache Tika. Results are cached per instance (up to 500 entries) and keyed
+        on the file identity (path, inode, modification time and size), which skips detection for unchanged files.
+
+        Args:
+            path: file path
+
+        Returns:
+            mimetype
+        """
+
+        stats = os.stat(path)
+        key = (path, stats.st_ino, stats.st_mtime_ns, stats.st_size)
+
+        mimetype = self.mimetypes.get(key)
+        if not mimetype:
+            mimetype = self.server("/detect/stream", path, {"Accept": "text/plain"}).text
+
+            # Reset cache when full
+            if len(self.mimetypes) >= 500:
+                self.mimetypes.clear()
+
+            self.mimetypes[key] = mimetype
+
+        return mimetype
+
+    def server(self, service, path, headers):
+        """
+        Sends a file to an Apache Tika server service. The Tika server is checked on each call and started, if necessary.
+        Requests use the pooled HTTP session to reuse connections to the server.
+
+        Args:
+            service: Tika service path
+            path: file path
+            headers: HTTP request headers
+
+        Returns:
+            response
+        """
+
+        # Resolve server endpoint. Starts a local server when not in client only mode. Tika settings are read at call
+        # time, as they can be changed after import.
+        endpoint = tikaclient.ServerEndpoint
+        if not tikaclient.TikaClientOnly:
+            with LOCK:
+                url = urlparse(endpoint)
+                endpoint = tikaclient.checkTikaServer(url.scheme, url.hostname, url.port)
+
+        # Send file name to help with content type detection
+        headers = {**headers, "Content-Disposition": self.disposition(path)}
+
+        with open(path, "rb") as f:
+            response = self.session.put(f"{endpoint}{service}", data=f, headers=headers, timeout=60)
+            response.raise_for_status()
+
+        return response
+
+    def disposition(self, path):
+        """
+        Builds a Content-Disposition header for path. HTTP header values must be Latin-1 encodable, so the file name
+        is sent as an ASCII fallback along with the full UTF-8 encoded name (RFC 5987).
+
+        Args:
+            path: file path
+
+        Returns:
+            Content-Disposition header value
+        """
+
+        name = os.path.basename(path)
+        fallback = name.encode("ascii", "replace").decode("ascii").replace("\\", "_").replace('"', "_")
+
+        return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(name)}"
 
 
 class Extract:
@@ -196,6 +426,34 @@ class Extract:
         self.paragraphs = paragraphs
         self.sections = sections
 
+        # Separators added before headings and after text blocks. These only depend on the parsing flags, which
+        # don't change, so they are resolved once here instead of for each node.
+        self.sectionbreak = "\f" if sections else "\n"
+        self.paragraphbreak = "\n\n" if paragraphs else "\n"
+
+        # Limits document parsing to elements used for text extraction
+        self.strainer = SoupStrainer(["article", "body", "main", "meta", "title"])
+
+        # Heading elements
+        self.headings = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+
+        # Elements skipped for articles and all other documents
+        self.articleskip = frozenset(["aside"])
+        self.skip = frozenset(["aside", "footer", "header"])
+
+        # Valid article text elements
+        self.textnodes = frozenset(["p", "th", "td", "li", "a", "b", "strong", "i", "em"])
+
+        # Markdown heading pattern
+        self.markdown = re.compile(r"#+ ")
+
+        # HTML charset declaration pattern
+        self.charset = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w-]+)", re.IGNORECASE)
+
+        # HTML document structure patterns for text and binary input
+        self.document = re.compile(r"<(article|body|main)[\s/>]", re.IGNORECASE)
+        self.documentbytes = re.compile(rb"<(article|body|main)[\s/>]", re.IGNORECASE)
+
     def __call__(self, html):
         """
         Transforms input HTML into Markdown formatted text.
@@ -207,73 +465,209 @@ class Extract:
             markdown formatted text
         """
 
-        # HTML Parser
-        soup = BeautifulSoup(html, features="html.parser")
+        # Plain text doesn't need to be parsed, use default text extraction
+        text = self.plaintext(html)
+        if text is not None:
+            return self.default(text)
 
-        # Ignore script and style tags
-        for script in soup.find_all(["script", "style"]):
+        # HTML Parser. Only parse elements used for text extraction when the input has a document structure.
+        encoding = self.encoding(html)
+        parser = self.parser(html, encoding)
+        soup = BeautifulSoup(html, features=parser, from_encoding=encoding, parse_only=self.strainer if parser == "lxml" else None)
+
+        # Find section elements along with script and style tags in a single pass
+        sections, scripts = {"article": [], "body": [], "main": []}, []
+        for node in soup.descendants:
+            if node.name in sections:
+                sections[node.name].append(node)
+            elif node.name in ("script", "style"):
+                scripts.append(node)
+
+        # Ignore script and style tags. Parser skips tags outside of the strainer elements but these tags are still
+        # parsed when nested within a body.
+        for script in scripts:
             script.decompose()
 
         # Check for article sections
-        article = next((x for x in ["article", "main"] if soup.find(x)), None)
+        article = next((x for x in ["article", "main"] if sections[x]), None)
 
-        # Extract text from each section element
-        nodes = []
-        for node in soup.find_all(article if article else "body"):
+        # Extract text from each section element into a single output list. Each section is preceded by a newline.
+        output = []
+        for node in sections[article if article else "body"]:
             # Skip article sections without at least 1 paragraph
             if not article or node.find("p"):
-                nodes.append(self.process(node, article))
+                output.append("\n")
+                self.traverse(node, article, any(parent.name == "a" for parent in node.parents), output)
+
+        # Fallback to default text extraction if no nodes found
+        if not output:
+            return self.default(soup.get_text())
+
+        # Add metadata section, if available. Otherwise, remove leading newline.
+        metadata = self.metadata(soup)
+        if metadata:
+            output.insert(0, "\n".join(metadata))
+        else:
+            output.pop(0)
+
+        # Return extracted text
+        return "".join(output)
+
+    def parser(self, html, encoding):
+        """
+        Selects the BeautifulSoup parser for the input html. The lxml parser is used when it's available and the input
+        has a document structure. Otherwise, the built-in html.parser is used. Input without a document structure (body,
+        article or main elements) is parsed with html.parser, since lxml wraps bare text in generated body elements.
+        Binary input with an unknown encoding is also parsed with html.parser, since lxml trusts charset declarations
+        even when the content doesn't decode with them.
+
+        Args:
+            html: input html
+            encoding: detected encoding of binary html
+
+        Returns:
+            parser name
+        """
+
+        if LXML and (encoding or not isinstance(html, bytes)):
+            pattern = self.documentbytes if isinstance(html, bytes) else self.document
+            if pattern.search(html):
+                return "lxml"
+
+        return "html.parser"
+
+    def encoding(self, html):
+        """
+        Detects the character encoding of binary html. This method checks for a charset declaration at the start of the
+        document and otherwise checks if the content is valid UTF-8. Declared encodings are only used when the content
+        decodes with them. Skipping BeautifulSoup's encoding detection saves significant time with large documents.
+
+        Args:
+            html: input html
 
-        # Return extracted text, fallback to default text extraction if no nodes found
-        return "\n".join(self.metadata(soup) + nodes) if nodes else self.default(soup)
+        Returns:
+            encoding if detected, None otherwise
+        """
+
+        # Encoding only applies to binary content. Byte order marks are handled by BeautifulSoup.
+        if not isinstance(html, bytes) or html.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return None
+
+        # Check for a charset declaration. Mislabelled content is left to BeautifulSoup's encoding detection.
+        match = self.charset.search(html, 0, 2048)
+        if match:
+            try:
+                encoding = codecs.lookup(match.group(1).decode("ascii")).name
+                html.decode(encoding)
+                return encoding
+            except LookupError:
+                pass
+            except UnicodeDecodeError:
+                return None
+
+        # Default to UTF-8 if content is valid UTF-8
+        try:
+            html.decode("utf-8")
+            return "utf-8"
+        except UnicodeDecodeError:
+            return None
 
-    def process(self, node, article):
+    def process(self, node, article, link=False):
         """
-        Extracts text from a node. This method applies transforms for headings, blockquotes, lists, code, tables and text.
-        Page breaks are detected and reflected in the output text as a page break character.
+        Extracts text from a node. See traverse for details on the transforms applied.
 
         Args:
             node: input node
             article: True if the main section node is an article
+            link: True if a parent of this node is a link, defaults to False
 
         Returns:
             node text
         """
 
-        if self.isheader(node):
-            return self.header(node, article)
+        output = []
+        self.traverse(node, article, link, output)
+
+        return "".join(output)
+
+    def traverse(self, node, article, link, output):
+        """
+        Extracts text from a node and appends it to output. This method applies transforms for headings, blockquotes, lists, code,
+        tables and text. Page breaks are detected and reflected in the output text as a page break character.
+
+        Text is appended to a single output list shared by all levels of the node tree. This avoids joining and copying text
+        again at each level of the tree.
+
+        Args:
+            node: input node
+            article: True if the main section node is an article
+            link: True if a parent of this node is a link
+            output: output list
+        """
+
+        name = node.name
+
+        # Track if this node or any parent nodes are a link
+        link = link or name == "a"
 
-        if node.name in ("blockquote", "q"):
-            return self.block(node)
+        if name in self.headings:
+            output.append(self.header(node, article, link))
 
-        if node.name in ("ul", "ol"):
-            return self.items(node, article)
+        elif name in {"blockquote", "q"}:
+            output.append(self.block(node))
 
-        if node.name in ("code", "pre"):
-            return self.code(node)
+        elif name in {"ul", "ol"}:
+            output.append(self.items(node, article, link))
 
-        if node.name == "table":
-            return self.table(node, article)
+        elif name in {"code", "pre"}:
+            output.append(self.code(node))
+
+        elif name == "table":
+            output.append(self.table(node, article, link))
 
         # Nodes to skip
-        if node.name in ("aside",) + (() if article else ("header", "footer")):
-            return ""
+        elif name not in (self.articleskip if article else self.skip):
+            # Get page break symbol, if section parsing enabled and available
+            classes = node.get("class") if self.sections and name else None
+            page = classes and "page" in classes
 
-        # Get page break symbol, if available
-        page = node.name and node.get("class") and "page" in node.get("class")
+            # Get node children
+            children = self.children(node)
 
-        # Get node children
-        children = self.children(node)
+            # Add container elements or node text
+            if self.iscontainer(node, children):
+                self.container(children, article, link, output)
+            else:
+                output.append(self.text(node, article, link))
 
-        # Join elements into text
-        if self.iscontainer(node, children):
-            texts = [self.process(node, article) for node in children]
-            text = "\n".join(text for text in texts if text or not article)
-        else:
-            text = self.text(node, article)
+            # Add page breaks, if available
+            if page:
+                output.append("\f")
 
-        # Add page breaks, if section parsing enabled. Otherwise add node text.
-        return f"{text}\f" if page and self.sections else text
+    def container(self, children, article, link, output):
+        """
+        Container handler. This method appends the text of each child node to output, separated by newlines.
+
+        Args:
+            children: container node children
+            article: True if the main section node is an article
+            link: True if the container node or a parent node is a link
+            output: output list
+        """
+
+        first = True
+        for child in children:
+            start = len(output)
+            if not first:
+                output.append("\n")
+
+            self.traverse(child, article, link, output)
+
+            # Article parsing skips empty elements
+            if article and not any(output[x] for x in range(start if first else start + 1, len(output))):
+                del output[start:]
+            else:
+                first = False
 
     def metadata(self, node):
         """
@@ -300,31 +694,57 @@ class Extract:
 
         return metadata
 
-    def default(self, soup):
+    def plaintext(self, html):
+        """
+        Checks if input is plain text without any markup or character references. Plain text is returned as a string.
+
+        Args:
+            html: input html
+
+        Returns:
+            text if input is plain text, None otherwise
+        """
+
+        # Markup and character references require HTML parsing
+        binary = isinstance(html, bytes)
+        if any(x in html for x in ((b"<", b"&") if binary else ("<", "&"))):
+            return None
+
+        # Decode binary content, if encoding is detected
+        if binary:
+            encoding = self.encoding(html)
+            return html.removeprefix(codecs.BOM_UTF8).decode(encoding) if encoding else None
+
+        return html
+
+    def default(self, text):
         """
         Default text handler when valid HTML isn't detected.
 
         Args:
-            soup: BeautifulSoup object
+            text: input text
 
         Returns:
             text
         """
 
-        lines = []
-        for line in soup.get_text().split("\n"):
-            # Detect markdown headings and add page breaks
-            lines.append(f"\f{line}" if self.sections and re.search(r"^#+ ", line) else line)
+        lines = text.split("\n")
+
+        # Detect markdown headings and add page breaks
+        if self.sections:
+            match = self.markdown.match
+            lines = [f"\f{line}" if line.startswith("#") and match(line) else line for line in lines]
 
         return "\n".join(lines)
 
-    def text(self, node, article):
+    def text(self, node, article, link):
         """
         Text handler. This method flattens a node and it's children to text.
 
         Args:
             node: input node
             article: True if the main section node is an article
+            link: True if this node or a parent node is a link
 
         Returns:
             node text
@@ -338,49 +758,47 @@ class Extract:
         texts = []
         for x in items:
             target, text = x if x.name else node, x.text
-
-            if text.strip():
-                if target.name in ("b", "strong"):
-                    text = f"**{text.strip()}** "
-                elif target.name in ("i", "em"):
-                    text = f"*{text.strip()}* "
-                elif target.name == "a":
-                    text = f"[{text.strip()}]({target.get('href')}) "
-
-            texts.append(text)
+            strip = text.strip()
+
+            # Add formatting and text as separate elements, these are joined once below
+            if strip and target.name in ("b", "strong"):
+                texts.extend(("**", strip, "** "))
+            elif strip and target.name in ("i", "em"):
+                texts.extend(("*", strip, "* "))
+            elif strip and target.name == "a":
+                texts.extend(("[", strip, "](", str(target.get("href")), ") "))
+            else:
+                texts.append(text)
 
         # Join text elements
         text = "".join(texts)
 
         # Article text processing
-        text = self.articletext(node, text) if article else text
+        text = self.articletext(node, text, link) if article else text
 
         # Return text, strip leading/trailing whitespace if this is a string only node
         text = text if node.name and text else text.strip()
 
         return text
 
-    def header(self, node, article):
+    def header(self, node, article, link):
         """
         Header handler. This method transforms a HTML heading into a Markdown formatted heading.
 
         Args:
             node: input node
             article: True if the main section node is an article
+            link: True if this node or a parent node is a link
 
         Returns:
             heading as markdown
         """
 
-        # Get heading level and text
-        level = "#" * int(node.name[1])
-        text = self.text(node, article)
-
-        # Add section break or newline, if necessary
-        level = f"\f{level}" if self.sections else f"\n{level}"
+        # Get heading text
+        text = self.text(node, article, link)
 
-        # Return formatted header. Remove leading whitespace as it was added before level in step above.
-        return f"{level} {text.lstrip()}" if text.strip() else ""
+        # Return formatted header with a section break or newline. Remove leading whitespace as it's added before the heading level.
+        return f"{self.sectionbreak}{'#' * int(node.name[1])} {text.lstrip()}" if text.strip() else ""
 
     def block(self, node):
         """
@@ -395,27 +813,28 @@ class Extract:
         """
 
         text = "\n".join(f"> {x}" for x in node.text.strip().split("\n"))
-        return f"{text}\n\n" if self.paragraphs else f"{text}\n"
+        return f"{text}{self.paragraphbreak}"
 
-    def items(self, node, article):
+    def items(self, node, article, link):
         """
         List handler. This method transforms a HTML ordered/unordered list into a Markdown formatted list.
 
         Args:
             node: input node
             article: True if the main section node is an article
+            link: True if this node or a parent node is a link
 
         Returns:
             list as markdown
         """
 
         elements = []
-        for x, element in enumerate(node.find_all("li")):
+        for x, element in enumerate(node.find_all("li", recursive=False)):
             # Unordered lists use dashes. Ordered lists use numbers.
             prefix = "-" if node.name == "ul" else f"{x + 1}."
 
             # List item text
-            text = self.process(element, article)
+            text = self.process(element, article, link)
 
             # Add list element
             if text:
@@ -436,16 +855,16 @@ class Extract:
             code as markdown
         """
 
-        text = f"```\n{node.text.strip()}\n```"
-        return f"{text}\n\n" if self.paragraphs else f"{text}\n"
+        return f"```\n{node.text.strip()}\n```{self.paragraphbreak}"
 
-    def table(self, node, article):
+    def table(self, node, article, link):
         """
         Table handler. This method transforms a HTML table into a Markdown formatted table.
 
         Args:
             node: input node
             article: True if the main section node is an article
+            link: True if this node or a parent node is a link
 
         Returns:
             table as markdown
@@ -453,14 +872,15 @@ class Extract:
 
         elements, header = [], False
 
-        # Process all rows
-        rows = node.find_all("tr")
+        # Process all rows, including rows within table sections. Nested tables are processed with their parent column.
+        sections = [node] + node.find_all(["thead", "tbody", "tfoot"], recursive=False)
+        rows = [row for section in sections for row in section.find_all("tr", recursive=False)]
         for row in rows:
             # Get list of columns for row
-            columns = row.find_all(lambda tag: tag.name in ("th", "td"))
+            columns = row.find_all(["th", "td"], recursive=False)
 
             # Add columns with separator
-            elements.append(f"|{'|'.join(self.process(column, article) for column in columns)}|")
+            elements.append(f"|{'|'.join(self.process(column, article, link) for column in columns)}|")
 
             # If there are multiple rows, add header format row
             if not header and len(rows) > 1:
@@ -502,7 +922,7 @@ class Extract:
 
         return None
 
-    def articletext(self, node, text):
+    def articletext(self, node, text, link):
         """
         Transforms node text using article parsing rules. Article parsing is designed to extract text content from web articles.
         It ignores navigation headers and other superfluous elements.
@@ -510,23 +930,25 @@ class Extract:
         Args:
             node: input node
             text: current text
+            link: True if this node or a parent node is a link
 
         Returns:
             article text
         """
 
-        # List of valid text nodes
-        valid = ["p", "th", "td", "li", "a", "b", "strong", "i", "em"]
+        # Skip nodes that aren't valid article text nodes
+        if node.name not in self.textnodes and not self.isheader(node):
+            return ""
 
         # Check if text is valid article text
-        text = text if (node.name in valid or self.isheader(node)) and not self.islink(node) else ""
+        text = text if not self.islink(node, link) else ""
         if text:
             # Replace non-breaking space plus newline with double newline
             text = text.replace("\xa0\n", "\n\n")
 
             # Format paragraph whitespace
             if node.name == "p":
-                text = f"{text.strip()}\n\n" if self.paragraphs else f"{text.strip()}\n"
+                text = f"{text.strip()}{self.paragraphbreak}"
 
         return text
 
@@ -541,27 +963,19 @@ class Extract:
             True if node is a header node, False otherwise
         """
 
-        return node.name in ["h1", "h2", "h3", "h4", "h5", "h6"]
+        return node.name in self.headings
 
-    def islink(self, node):
+    def islink(self, node, link):
         """
         Checks if node is a link node. This method does not consider links without tables as link nodes.
 
         Args:
             node: input node
+            link: True if this node or a parent node is a link
 
         Returns:
             True if node is a link node, False otherwise
         """
 
-        # Check if this is a link node or link container
-        link, parent = False, node
-        while parent:
-            if parent.name == "a":
-                link = True
-                break
-
-            parent = parent.parent
-
         # Return if this node or any parents are a link. Ignore links in table cells.
         return link and node.parent.name not in ("th", "td")
@@ -2,6 +2,10 @@
 Summary module tests
 """
 
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
 from txtai.pipeline import Textractor
@@ -57,6 +61,32 @@ class TestTextractor(unittest.TestCase):
         # Check number of sections is as expected
         self.assertEqual(len(sections), 2)
 
+    def testEncoding(self):
+        """
+        Test encoding detection with binary input
+        """
+
+        extract = Textractor().extract
+
+        # Declared encodings
+        self.assertEqual(extract.encoding(b'<html><head><meta charset="latin-1"></head><body>caf\xe9</body></html>'), "iso8859-1")
+        self.assertEqual(extract.encoding(b'<html><head><meta charset="utf-8"></head><body>caf\xe9</body></html>'), None)
+        self.assertEqual(extract.encoding(b'<html><head><meta charset="unknown"></head><body>caf\xc3\xa9</body></html>'), "utf-8")
+
+        # Undeclared encodings
+        self.assertEqual(extract.encoding(b"caf\xc3\xa9"), "utf-8")
+        self.assertEqual(extract.encoding(b"caf\xe9"), None)
+        self.assertEqual(extract.encoding("café"), None)
+
+        # Plain text
+        self.assertEqual(extract.plaintext(b"caf\xc3\xa9"), "café")
+        self.assertEqual(extract.plaintext(b"\xef\xbb\xbfcaf\xc3\xa9"), "café")
+        self.assertEqual(extract.plaintext(b"caf\xe9"), None)
+        self.assertEqual(extract.plaintext(b"<p>caf\xc3\xa9</p>"), None)
+
+        # Mislabelled content
+        self.assertEqual(extract(b'<html><head><meta charset="utf-8"></head><body><p>caf\xe9</p></body></html>'), "café")
+
     def testLines(self):
         """
         Test extraction to lines
@@ -85,6 +115,7 @@ class TestTextractor(unittest.TestCase):
         # Lists
         self.assertMarkdown("<ul><li>Test1</li><li>Test2</li></ul>", "- Test1\n- Test2")
         self.assertMarkdown("<ol><li>Test1</li><li>Test2</li></ol>", "1. Test1\n2. Test2")
+        self.assertMarkdown("<ul><li>Test1</li><li><ol><li>Test2</li><li>Test3</li></ol></li></ul>", "- Test1\n- 1. Test2\n2. Test3")
 
         # Code
         self.assertMarkdown("<code>This is a test</code>", "```\nThis is a test\n```")
@@ -95,6 +126,10 @@ class TestTextractor(unittest.TestCase):
             "<table><tr><th>Header1</th><th>Header2</th></tr><tr><td>Test1</td><td>Test2</td></tr></table>",
             "|Header1|Header2|\n|---|---|\n|Test1|Test2|",
         )
+        self.assertMarkdown(
+            "<table><thead><tr><th>Header1</th></tr></thead><tbody><tr><td>Test1</td></tr></tbody></table>",
+            "|Header1|\n|---|\n|Test1|",
+        )
 
         # Ignore list
         self.assertMarkdown("<aside>This is a test</aside>", "")
@@ -111,6 +146,37 @@ class TestTextractor(unittest.TestCase):
         self.assertMarkdown("<p>This is a <strong><em>test</em></strong></p>", "This is a **test**")
         self.assertMarkdown("<p>This is a <em><strong>test</strong></em></p>", "This is a *test*")
 
+    def testMimetype(self):
+        """
+        Test mimetype detection using file extensions and signatures
+        """
+
+        textractor = Textractor(tika=False)
+
+        with tempfile.TemporaryDirectory() as directory:
+            files = {
+                "document.md": (b"# Heading", "text/plain"),
+                "document.pdf": (b"%PDF-1.7", "application/pdf"),
+                "document.zip": (b"PK\x03\x04", "application/zip"),
+                "document.doc": (b"\xd0\xcf\x11\xe0", "application/x-tika-msoffice"),
+                "document": (b"\xef\xbb\xbf\n <!DOCTYPE html><html></html>", "text/html"),
+            }
+
+            for name, (data, mimetype) in files.items():
+                path = os.path.join(directory, name)
+                with open(path, "wb") as f:
+                    f.write(data)
+
+                # Check mimetype is detected without Tika
+                self.assertEqual(textractor.mimetype(path), mimetype)
+
+            # Check unknown signatures
+            path = os.path.join(directory, "unknown")
+            with open(path, "wb") as f:
+                f.write(b"\x00\x01\x02")
+
+            self.assertIsNone(textractor.sniff(path))
+
     def testParagraphs(self):
         """
         Test extraction to paragraphs
@@ -124,6 +190,14 @@ class TestTextractor(unittest.TestCase):
         # Check number of paragraphs is as expected
         self.assertEqual(len(paragraphs), 11)
 
+    def testPickle(self):
+        """
+        Test pipeline can be pickled
+        """
+
+        textractor = pickle.loads(pickle.dumps(Textractor()))
+        self.assertEqual(textractor("<html><body><p>This is a test</p></body></html>"), "This is a test")
+
     def testSections(self):
         """
         Test extraction to sections
@@ -177,6 +251,26 @@ class TestTextractor(unittest.TestCase):
             # Check for table header
             self.assertTrue("|---|" in text)
 
+    def testUnicode(self):
+        """
+        Test extraction with a non-ASCII file name
+        """
+
+        textractor = Textractor()
+
+        # Check header values are Latin-1 encodable
+        header = textractor.disposition("/tmp/文档.pdf")
+        self.assertEqual(header, "attachment; filename=\"??.pdf\"; filename*=UTF-8''%E6%96%87%E6%A1%A3.pdf")
+        header.encode("latin-1")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "文档.pdf")
+            shutil.copy(Utils.PATH + "/article.pdf", path)
+
+            # Check length of text is as expected
+            text = textractor(path)
+            self.assertEqual(len(text), 2471)
+
     def testURL(self):
         """
         Test parsing a remote URL
@@ -186,6 +280,16 @@ class TestTextractor(unittest.TestCase):
         text = textractor("https://github.com/neuml/txtai")
         self.assertTrue("txtai is an all-in-one embeddings database" in text)
 
+    def testWorkers(self):
+        """
+        Test extraction with multiple workers
+        """
+
+        files = [f"{Utils.PATH}/{name}" for name in ["article.pdf", "document.docx", "spreadsheet.xlsx"]]
+
+        # Check concurrent extraction returns the same results in order
+        self.assertEqual(Textractor(workers=2)(files), Textractor()(files))
+
     def assertMarkdown(self, html, expected):
         """
         Helper method to assert generated markdown is as expected.